@@ -7,6 +7,8 @@ import (
 	"math/rand"
 	"net/http"
 	"os"
+	"strconv"
+	"strings"
 	"sync"
 	"time"
 
@@ -32,9 +34,52 @@ type NetworkNode struct {
 type NetworkTopology struct {
 	mu    sync.RWMutex
 	nodes map[string]*NetworkNode
-	edges map[string][]string // Adjacency list for routing
+
+	// Dense routing view: every node gets a stable integer index so the
+	// BFS walks can use slices instead of string-keyed maps
+	index map[string]int // Node ID -> index into ids/adj
+	ids   []string       // Index -> node ID
+	byIdx []*NetworkNode // Index -> node, so searches skip the ID map
+	adj   [][]int        // Adjacency list for routing, by index
+	kinds []nodeKind     // Node type, by index
+
+	// BFS results per source index, reused until the graph changes.
+	// Requests fill this while only holding nt.mu.RLock, so it has its
+	// own lock; AddNode/ConnectNodes drop it under the write lock.
+	routesMu sync.Mutex
+	routes   map[int]hopResult
+}
+
+// nodeKind is NetworkNode.Type coded as an integer for the routing view
+type nodeKind uint8
+
+const (
+	kindUnknown nodeKind = iota
+	kindOrigin
+	kindEdge
+	kindPeer
+)
+
+func kindOf(nodeType string) nodeKind {
+	switch nodeType {
+	case "origin":
+		return kindOrigin
+	case "edge":
+		return kindEdge
+	case "peer":
+		return kindPeer
+	}
+	return kindUnknown
+}
+
+// hopResult is a cached hopCounts walk
+type hopResult struct {
+	dist, order, parent []int
 }
 
+// maxCachedRoutes bounds the BFS cache; it is emptied when full
+const maxCachedRoutes = 1024
+
 // Request represents a content request
 type Request struct {
 	RequestID    string    `json:"requestId"`
@@ -60,7 +105,7 @@ type RequestResponse struct {
 func NewNetworkTopology() *NetworkTopology {
 	return &NetworkTopology{
 		nodes: make(map[string]*NetworkNode),
-		edges: make(map[string][]string),
+		index: make(map[string]int),
 	}
 }
 
@@ -69,22 +114,37 @@ func (nt *NetworkTopology) AddNode(node *NetworkNode) {
 	defer nt.mu.Unlock()
 	
 	nt.nodes[node.ID] = node
-	nt.edges[node.ID] = make([]string, 0)
+	nt.routes = nil
+	if i, exists := nt.index[node.ID]; exists {
+		nt.byIdx[i] = node
+		nt.adj[i] = nil
+		nt.kinds[i] = kindOf(node.Type)
+		return
+	}
+	nt.index[node.ID] = len(nt.ids)
+	nt.ids = append(nt.ids, node.ID)
+	nt.byIdx = append(nt.byIdx, node)
+	nt.adj = append(nt.adj, nil)
+	nt.kinds = append(nt.kinds, kindOf(node.Type))
 }
 
 func (nt *NetworkTopology) ConnectNodes(node1ID, node2ID string) {
 	nt.mu.Lock()
 	defer nt.mu.Unlock()
 	
-	if node1, exists := nt.nodes[node1ID]; exists {
-		node1.Connections = append(node1.Connections, node2ID)
-		nt.edges[node1ID] = append(nt.edges[node1ID], node2ID)
+	node1, exists1 := nt.nodes[node1ID]
+	node2, exists2 := nt.nodes[node2ID]
+	if !exists1 || !exists2 {
+		return
 	}
 	
-	if node2, exists := nt.nodes[node2ID]; exists {
-		node2.Connections = append(node2.Connections, node1ID)
-		nt.edges[node2ID] = append(nt.edges[node2ID], node1ID)
-	}
+	node1.Connections = append(node1.Connections, node2ID)
+	node2.Connections = append(node2.Connections, node1ID)
+	nt.routes = nil
+	
+	i, j := nt.index[node1ID], nt.index[node2ID]
+	nt.adj[i] = append(nt.adj[i], j)
+	nt.adj[j] = append(nt.adj[j], i)
 }
 
 func (nt *NetworkTopology) FindShortestPath(from, to string) ([]string, int) {
@@ -96,25 +156,26 @@ func (nt *NetworkTopology) FindShortestPath(from, to string) ([]string, int) {
 		return []string{from}, 0
 	}
 	
+	src, srcOK := nt.index[from]
+	dst, dstOK := nt.index[to]
+	if !srcOK || !dstOK {
+		return nil, -1
+	}
+	
 	// Simple BFS for shortest path
-	queue := []string{from}
-	visited := make(map[string]bool)
-	parent := make(map[string]string)
+	queue := []int{src}
+	visited := make([]bool, len(nt.ids))
+	parent := make([]int, len(nt.ids))
 	
-	visited[from] = true
+	visited[src] = true
+	parent[src] = -1
 	
 	for len(queue) > 0 {
 		current := queue[0]
 		queue = queue[1:]
 		
-		if current == to {
-			// Reconstruct path
-			path := []string{}
-			node := to
-			for node != "" {
-				path = append([]string{node}, path...)
-				node = parent[node]
-			}
+		if current == dst {
+			path := nt.tracePath(parent, dst)
 			hops := len(path) - 1
 			if hops < 0 {
 				hops = 0 // Same node = 0 hops
@@ -122,7 +183,7 @@ func (nt *NetworkTopology) FindShortestPath(from, to string) ([]string, int) {
 			return path, hops
 		}
 		
-		for _, neighbor := range nt.edges[current] {
+		for _, neighbor := range nt.adj[current] {
 			if !visited[neighbor] {
 				visited[neighbor] = true
 				parent[neighbor] = current
@@ -139,35 +200,32 @@ func (nt *NetworkTopology) FindSegment(segmentID, fromNode string) *RequestRespo
 	defer nt.mu.RUnlock()
 	
 	// Strategy: Check P2P peers first, then edge servers, then origin
+	now := time.Now()
 	response := &RequestResponse{
-		RequestID: fmt.Sprintf("req_%d", time.Now().UnixNano()),
-		Timestamp: time.Now(),
+		RequestID: "req_" + strconv.FormatInt(now.UnixNano(), 10),
+		Timestamp: now,
 	}
 	
 	// Convert segmentID to alternative format for checking
-	var altSegmentID string
-	if len(segmentID) >= 12 && segmentID[:8] == "segment" {
-		// Convert "segment003.ts" to "song_003"
-		var segmentNum int
-		fmt.Sscanf(segmentID, "segment%03d.ts", &segmentNum)
-		altSegmentID = fmt.Sprintf("song_%03d", segmentNum)
-	} else if len(segmentID) >= 6 && segmentID[:4] == "song" {
-		// Convert "song_003" to "segment003.ts"
-		var segmentNum int
-		fmt.Sscanf(segmentID, "song_%03d", &segmentNum)
-		altSegmentID = fmt.Sprintf("segment%03d.ts", segmentNum)
+	altSegmentID := alternateSegmentID(segmentID)
+	
+	// Walk the graph once from the requester; the peer search and every
+	// closest-node pick below reuse the same hop counts
+	var dist, order, parent []int
+	if src, exists := nt.index[fromNode]; exists {
+		dist, order, parent = nt.cachedHopCounts(src)
 	}
 	
 	// 1. Check P2P peers (within 3 hops) - check both formats
-	peerNodes := nt.findPeersWithSegment(segmentID, fromNode, 3)
+	peerNodes := nt.findPeersWithSegment(segmentID, order, dist, 3)
 	if len(peerNodes) == 0 && altSegmentID != "" {
-		peerNodes = nt.findPeersWithSegment(altSegmentID, fromNode, 3)
+		peerNodes = nt.findPeersWithSegment(altSegmentID, order, dist, 3)
 	}
 	if len(peerNodes) > 0 {
 		// Find closest peer
-		closestPeer := nt.findClosestNode(fromNode, peerNodes)
+		closestPeer := nt.findClosestNode(peerNodes, dist)
 		if closestPeer != "" {
-			path, hops := nt.FindShortestPath(fromNode, closestPeer)
+			path, hops := nt.routeTo(fromNode, closestPeer, dist, parent)
 			response.Success = true
 			response.Source = "peer"
 			response.Hops = hops
@@ -183,9 +241,9 @@ func (nt *NetworkTopology) FindSegment(segmentID, fromNode string) *RequestRespo
 		edgeNodes = nt.findEdgeServersWithSegment(altSegmentID)
 	}
 	if len(edgeNodes) > 0 {
-		closestEdge := nt.findClosestNode(fromNode, edgeNodes)
+		closestEdge := nt.findClosestNode(edgeNodes, dist)
 		if closestEdge != "" {
-			path, hops := nt.FindShortestPath(fromNode, closestEdge)
+			path, hops := nt.routeTo(fromNode, closestEdge, dist, parent)
 			response.Success = true
 			response.Source = "edge"
 			response.Hops = hops
@@ -201,9 +259,9 @@ func (nt *NetworkTopology) FindSegment(segmentID, fromNode string) *RequestRespo
 		originNodes = nt.findOriginServersWithSegment(altSegmentID)
 	}
 	if len(originNodes) > 0 {
-		closestOrigin := nt.findClosestNode(fromNode, originNodes)
+		closestOrigin := nt.findClosestNode(originNodes, dist)
 		if closestOrigin != "" {
-			path, hops := nt.FindShortestPath(fromNode, closestOrigin)
+			path, hops := nt.routeTo(fromNode, closestOrigin, dist, parent)
 			response.Success = true
 			response.Source = "origin"
 			response.Hops = hops
@@ -217,56 +275,78 @@ func (nt *NetworkTopology) FindSegment(segmentID, fromNode string) *RequestRespo
 	return response
 }
 
-func (nt *NetworkTopology) findPeersWithSegment(segmentID, fromNode string, maxHops int) []string {
-	var peers []string
+// routeTo returns the same path and hop count as FindShortestPath(fromNode,
+// to), but reads it off the requester's hopCounts walk instead of running
+// another BFS. dist and parent are nil when fromNode is unknown.
+func (nt *NetworkTopology) routeTo(fromNode, to string, dist, parent []int) ([]string, int) {
+	if fromNode == to {
+		return []string{fromNode}, 0
+	}
+	
+	dst, exists := nt.index[to]
+	if !exists || dist == nil || dist[dst] == -1 {
+		return nil, -1
+	}
 	
-	// BFS to find peers within maxHops
-	queue := []string{fromNode}
-	visited := make(map[string]bool)
-	hops := make(map[string]int)
+	path := nt.tracePath(parent, dst)
+	return path, len(path) - 1
+}
+
+// tracePath reconstructs the route from the BFS source to dst by walking
+// parents back from the target, then reversing in place instead of
+// prepending (which copies the whole slice on every hop)
+func (nt *NetworkTopology) tracePath(parent []int, dst int) []string {
+	path := []string{}
+	for node := dst; node != -1; node = parent[node] {
+		path = append(path, nt.ids[node])
+	}
+	for i, j := 0, len(path)-1; i < j; i, j = i+1, j-1 {
+		path[i], path[j] = path[j], path[i]
+	}
+	return path
+}
+
+// alternateSegmentID maps between the two segment naming schemes
+// ("segment003.ts" <-> "song_003"). It returns "" for unrecognised IDs.
+func alternateSegmentID(segmentID string) string {
+	if len(segmentID) >= 12 && strings.HasPrefix(segmentID, "segment") {
+		// Convert "segment003.ts" to "song_003"
+		var segmentNum int
+		fmt.Sscanf(segmentID, "segment%03d.ts", &segmentNum)
+		return fmt.Sprintf("song_%03d", segmentNum)
+	} else if len(segmentID) >= 6 && segmentID[:4] == "song" {
+		// Convert "song_003" to "segment003.ts"
+		var segmentNum int
+		fmt.Sscanf(segmentID, "song_%03d", &segmentNum)
+		return fmt.Sprintf("segment%03d.ts", segmentNum)
+	}
+	return ""
+}
+
+// findPeersWithSegment returns the peers holding segmentID that lie within
+// maxHops of the requester, in BFS order. order and dist come from
+// hopCounts on the requester.
+func (nt *NetworkTopology) findPeersWithSegment(segmentID string, order, dist []int, maxHops int) []string {
+	var peers []string
 	
-	visited[fromNode] = true
-	hops[fromNode] = 0
+	// The alternative format only depends on segmentID, so resolve it once
+	// instead of for every node visited
+	altSegmentID := alternateSegmentID(segmentID)
 	
-	for len(queue) > 0 {
-		current := queue[0]
-		queue = queue[1:]
-		
-		if hops[current] >= maxHops {
-			continue
+	// BFS order is sorted by hop count, so stop at the first node that is
+	// too far away
+	for _, i := range order {
+		if dist[i] >= maxHops {
+			break
 		}
 		
-		if node, exists := nt.nodes[current]; exists && node.Type == "peer" {
-			// Check both segment formats
-			if node.Storage[segmentID] {
-				peers = append(peers, current)
-			} else {
-				// Check alternative format
-				var altSegmentID string
-				if len(segmentID) >= 12 && segmentID[:8] == "segment" {
-					// Convert "segment003.ts" to "song_003"
-					var segmentNum int
-					fmt.Sscanf(segmentID, "segment%03d.ts", &segmentNum)
-					altSegmentID = fmt.Sprintf("song_%03d", segmentNum)
-				} else if len(segmentID) >= 6 && segmentID[:4] == "song" {
-					// Convert "song_003" to "segment003.ts"
-					var segmentNum int
-					fmt.Sscanf(segmentID, "song_%03d", &segmentNum)
-					altSegmentID = fmt.Sprintf("segment%03d.ts", segmentNum)
-				}
-				
-				if altSegmentID != "" && node.Storage[altSegmentID] {
-					peers = append(peers, current)
-				}
-			}
+		if nt.kinds[i] != kindPeer {
+			continue
 		}
 		
-		for _, neighbor := range nt.edges[current] {
-			if !visited[neighbor] {
-				visited[neighbor] = true
-				hops[neighbor] = hops[current] + 1
-				queue = append(queue, neighbor)
-			}
+		// Check both segment formats
+		if node := nt.byIdx[i]; node.Storage[segmentID] || (altSegmentID != "" && node.Storage[altSegmentID]) {
+			peers = append(peers, nt.ids[i])
 		}
 	}
 	
@@ -276,40 +356,32 @@ func (nt *NetworkTopology) findPeersWithSegment(segmentID, fromNode string, maxH
 func (nt *NetworkTopology) findEdgeServersWithSegment(segmentID string) []string {
 	var edges []string
 	
-	for _, node := range nt.nodes {
-		if node.Type == "edge" && node.Storage[segmentID] {
-			edges = append(edges, node.ID)
+	for i, kind := range nt.kinds {
+		if kind == kindEdge && nt.byIdx[i].Storage[segmentID] {
+			edges = append(edges, nt.ids[i])
 		}
 	}
 	
 	return edges
 }
 
-func (nt *NetworkTopology) findOriginServers() []string {
-	var origins []string
-	
-	for _, node := range nt.nodes {
-		if node.Type == "origin" {
-			origins = append(origins, node.ID)
-		}
-	}
-	
-	return origins
-}
-
 func (nt *NetworkTopology) findOriginServersWithSegment(segmentID string) []string {
 	var origins []string
 	
-	for _, node := range nt.nodes {
-		if node.Type == "origin" && node.Storage[segmentID] {
-			origins = append(origins, node.ID)
+	for i, kind := range nt.kinds {
+		if kind == kindOrigin && nt.byIdx[i].Storage[segmentID] {
+			origins = append(origins, nt.ids[i])
 		}
 	}
 	
 	return origins
 }
 
-func (nt *NetworkTopology) findClosestNode(fromNode string, candidates []string) string {
+// findClosestNode picks the candidate with the fewest hops from the
+// requester, using the dist slice from hopCounts rather than running a
+// separate shortest-path search per candidate. A nil dist (unknown
+// requester) falls back to the first candidate.
+func (nt *NetworkTopology) findClosestNode(candidates []string, dist []int) string {
 	if len(candidates) == 0 {
 		return ""
 	}
@@ -317,10 +389,17 @@ func (nt *NetworkTopology) findClosestNode(fromNode string, candidates []string)
 	closest := candidates[0]
 	minHops := 999
 	
+	if dist == nil {
+		return closest
+	}
+	
 	for _, candidate := range candidates {
-		_, hops := nt.FindShortestPath(fromNode, candidate)
-		if hops < minHops && hops > 0 {
-			minHops = hops
+		i, exists := nt.index[candidate]
+		if !exists {
+			continue
+		}
+		if h := dist[i]; h < minHops && h > 0 {
+			minHops = h
 			closest = candidate
 		}
 	}
@@ -328,6 +407,64 @@ func (nt *NetworkTopology) findClosestNode(fromNode string, candidates []string)
 	return closest
 }
 
+// hopCounts runs a BFS from src. It returns the hop distance to every
+// node, indexed like nt.ids (-1 when unreachable), the order in which
+// reachable nodes were visited, and each node's BFS parent (-1 for src),
+// which gives the same paths FindShortestPath would. Callers must hold
+// nt.mu.
+func (nt *NetworkTopology) hopCounts(src int) (dist, order, parent []int) {
+	dist = make([]int, len(nt.ids))
+	for i := range dist {
+		dist[i] = -1
+	}
+	dist[src] = 0
+	parent = make([]int, len(nt.ids))
+	parent[src] = -1
+	
+	// The queue is never popped from the front, so once the walk is done
+	// it doubles as the visit order
+	order = make([]int, 1, len(nt.ids))
+	order[0] = src
+	for head := 0; head < len(order); head++ {
+		current := order[head]
+		for _, neighbor := range nt.adj[current] {
+			if dist[neighbor] == -1 {
+				dist[neighbor] = dist[current] + 1
+				parent[neighbor] = current
+				order = append(order, neighbor)
+			}
+		}
+	}
+	
+	return dist, order, parent
+}
+
+// cachedHopCounts is hopCounts backed by nt.routes, so repeated requests
+// from the same node skip the walk while the graph is unchanged. The
+// returned slices are shared and must not be modified. Callers must hold
+// nt.mu.
+func (nt *NetworkTopology) cachedHopCounts(src int) (dist, order, parent []int) {
+	nt.routesMu.Lock()
+	r, exists := nt.routes[src]
+	nt.routesMu.Unlock()
+	if exists {
+		return r.dist, r.order, r.parent
+	}
+	
+	// Walk without routesMu so concurrent misses don't queue behind each
+	// other; the graph cannot change meanwhile since nt.mu is held. Two
+	// requests missing on the same source just store equal results.
+	dist, order, parent = nt.hopCounts(src)
+	
+	nt.routesMu.Lock()
+	if nt.routes == nil || len(nt.routes) >= maxCachedRoutes {
+		nt.routes = make(map[int]hopResult)
+	}
+	nt.routes[src] = hopResult{dist: dist, order: order, parent: parent}
+	nt.routesMu.Unlock()
+	return dist, order, parent
+}
+
 func (nt *NetworkTopology) calculateLatency(path []string) int {
 	totalLatency := 0
 	for i := 0; i < len(path)-1; i++ {
@@ -347,14 +484,27 @@ func main() {
 	
 	topology := NewNetworkTopology()
 	
+	// Use a dedicated, seedable source so a topology can be reproduced
+	// with TOPOLOGY_SEED instead of drawing from the shared global one
+	seed := time.Now().UnixNano()
+	if v := os.Getenv("TOPOLOGY_SEED"); v != "" {
+		if n, err := strconv.ParseInt(v, 10, 64); err == nil {
+			seed = n
+		}
+	}
+	log.Printf("Topology seed: %d", seed)
+	
 	// Create realistic network topology
-	createRealisticTopology(topology)
+	createRealisticTopology(topology, rand.New(rand.NewSource(seed)))
 	
 	// Start HTTP server
 	r := chi.NewRouter()
 	r.Use(middleware.RequestID)
 	r.Use(middleware.RealIP)
-	r.Use(middleware.Logger)
+	// REQUEST_LOG=0 disables access logs (see DEMO_GUIDE.md)
+	if getenv("REQUEST_LOG", "1") != "0" {
+		r.Use(middleware.Logger)
+	}
 	r.Use(middleware.Recoverer)
 	r.Use(corsMiddleware)
 	
@@ -402,6 +552,30 @@ func main() {
 		
 		w.WriteHeader(http.StatusOK)
 	})
+	
+	// Batch form of /add-segment: many node/segment pairs in one request,
+	// applied under a single lock
+	r.Post("/add-segments", func(w http.ResponseWriter, r *http.Request) {
+		var data []struct {
+			NodeID    string `json:"nodeId"`
+			SegmentID string `json:"segmentId"`
+		}
+		
+		if err := json.NewDecoder(r.Body).Decode(&data); err != nil {
+			http.Error(w, err.Error(), http.StatusBadRequest)
+			return
+		}
+		
+		topology.mu.Lock()
+		for _, d := range data {
+			if node, exists := topology.nodes[d.NodeID]; exists {
+				node.Storage[d.SegmentID] = true
+			}
+		}
+		topology.mu.Unlock()
+		
+		w.WriteHeader(http.StatusOK)
+	})
 
 	// Seed a few peers with a given segment for demo (to show P2P paths)
 	r.Post("/seed-demo", func(w http.ResponseWriter, r *http.Request) {
@@ -430,7 +604,7 @@ func main() {
 	log.Fatal(http.ListenAndServe(":"+port, r))
 }
 
-func createRealisticTopology(topology *NetworkTopology) {
+func createRealisticTopology(topology *NetworkTopology, rng *rand.Rand) {
 	// Create origin server
 	origin := &NetworkNode{
 		ID:        "origin-1",
@@ -469,7 +643,7 @@ func createRealisticTopology(topology *NetworkTopology) {
 		
 		// Edge servers have partial content (random segments, both formats)
 		for j := 0; j < 8; j++ {
-			if rand.Float64() < 0.7 { // 70% chance to have each segment
+			if rng.Float64() < 0.7 { // 70% chance to have each segment
 				edge.Storage[fmt.Sprintf("segment%03d.ts", j)] = true
 				edge.Storage[fmt.Sprintf("song_%03d", j)] = true
 			}
@@ -483,7 +657,7 @@ func createRealisticTopology(topology *NetworkTopology) {
 	peerRegions := []string{"us-east", "us-west", "us-central", "eu-west", "eu-central", "asia-pacific", "asia-southeast", "canada", "australia", "japan", "india", "brazil"}
 	
 	for i := 0; i < 50; i++ {
-		region := peerRegions[rand.Intn(len(peerRegions))]
+		region := peerRegions[rng.Intn(len(peerRegions))]
 		peer := &NetworkNode{
 			ID:        fmt.Sprintf("peer-%d", i+1),
 			Type:      "peer",
@@ -497,37 +671,44 @@ func createRealisticTopology(topology *NetworkTopology) {
 		}
 		
 		// Peers have very limited content (random 1-3 segments)
-		segmentCount := rand.Intn(3) + 1
+		segmentCount := rng.Intn(3) + 1
 		for j := 0; j < segmentCount; j++ {
-			segmentID := fmt.Sprintf("song_%03d", rand.Intn(10))
+			segmentID := fmt.Sprintf("song_%03d", rng.Intn(10))
 			peer.Storage[segmentID] = true
 		}
 		
 		topology.AddNode(peer)
 	}
 	
+	// Walk nodes in an rng-driven order rather than map iteration order,
+	// which Go randomises independently of any seed
+	ids := topology.ids
+	var edgeIDs []string
+	for _, id := range ids {
+		if topology.nodes[id].Type == "edge" {
+			edgeIDs = append(edgeIDs, id)
+		}
+	}
+	
 	// Connect peers to each other (P2P mesh)
 	// Only 3-4 peers connect directly to edge servers
 	edgeConnections := 0
-	for _, peer := range topology.nodes {
+	for _, pi := range rng.Perm(len(ids)) {
+		peer := topology.nodes[ids[pi]]
 		if peer.Type == "peer" {
 			// 6% chance to connect to edge server
-			if rand.Float64() < 0.06 && edgeConnections < 4 {
+			if rng.Float64() < 0.06 && edgeConnections < 4 && len(edgeIDs) > 0 {
 				// Connect to random edge server
-				for _, edge := range topology.nodes {
-					if edge.Type == "edge" {
-						topology.ConnectNodes(peer.ID, edge.ID)
-						edgeConnections++
-						break
-					}
-				}
+				topology.ConnectNodes(peer.ID, edgeIDs[rng.Intn(len(edgeIDs))])
+				edgeConnections++
 			}
 			
 			// Connect to 2-5 other peers
-			peerConnections := rand.Intn(4) + 2
+			peerConnections := rng.Intn(4) + 2
 			connected := 0
 			
-			for _, otherPeer := range topology.nodes {
+			for _, oi := range rng.Perm(len(ids)) {
+				otherPeer := topology.nodes[ids[oi]]
 				if otherPeer.Type == "peer" && otherPeer.ID != peer.ID && connected < peerConnections {
 					// Higher chance to connect to peers in same region
 					connectProb := 0.3
@@ -535,7 +716,7 @@ func createRealisticTopology(topology *NetworkTopology) {
 						connectProb = 0.8
 					}
 					
-					if rand.Float64() < connectProb {
+					if rng.Float64() < connectProb {
 						topology.ConnectNodes(peer.ID, otherPeer.ID)
 						connected++
 					}
@@ -40,6 +40,23 @@ var songManager = &SongManager{
 	songs: make(map[string]*Song),
 }
 
+// hlsBitrates are the renditions produced for every upload
+var hlsBitrates = []string{"128k", "192k"}
+
+// segmentCount is the number of segments each song is published with
+// (assumed, not read back from FFmpeg's output)
+const segmentCount = 8
+
+// songSegments is the segment list every processed song reports. It is the
+// same for each upload, so it is built once and shared read-only.
+var songSegments = func() []string {
+	segments := make([]string, 0, segmentCount)
+	for i := 0; i < segmentCount; i++ {
+		segments = append(segments, fmt.Sprintf("segment%03d.ts", i))
+	}
+	return segments
+}()
+
 func (sm *SongManager) AddSong(song *Song) {
 	sm.mu.Lock()
 	defer sm.mu.Unlock()
@@ -119,17 +136,10 @@ func processAudioFile(file multipart.File, header *multipart.FileHeader, title,
 			return
 		}
 		
-		// Generate segments list
-		segments := []string{}
-		for i := 0; i < 8; i++ { // Assuming 8 segments
-			segments = append(segments, fmt.Sprintf("segment%03d.ts", i))
-		}
-		
-		bitrates := []string{"128k", "192k"}
-		songManager.UpdateSongSegments(songID, segments, bitrates)
+		songManager.UpdateSongSegments(songID, songSegments, hlsBitrates)
 		
 		// Update network topology with new segments
-		updateNetworkTopology(songID, segments)
+		updateNetworkTopology(songID, songSegments)
 		
 		log.Printf("✅ Song %s processed successfully", songID)
 	}()
@@ -138,9 +148,7 @@ func processAudioFile(file multipart.File, header *multipart.FileHeader, title,
 }
 
 func processAudioToHLS(inputPath, outputDir, songID string) error {
-	bitrates := []string{"128k", "192k"}
-	
-	for _, bitrate := range bitrates {
+	for _, bitrate := range hlsBitrates {
 		bitrateDir := filepath.Join(outputDir, bitrate)
 		if err := os.MkdirAll(bitrateDir, 0755); err != nil {
 			return fmt.Errorf("failed to create bitrate directory: %w", err)
@@ -169,41 +177,36 @@ func processAudioToHLS(inputPath, outputDir, songID string) error {
 }
 
 func updateNetworkTopology(songID string, segments []string) {
+	// Collect every placement and send them in one /add-segments call
+	// rather than one request per segment and node
+	placements := make([]map[string]string, 0, 2*len(segments))
+	
 	// Add new segments to origin server
 	for _, segment := range segments {
-		reqBody := map[string]string{
+		placements = append(placements, map[string]string{
 			"nodeId":    "origin-1",
 			"segmentId": segment,
-		}
-		
-		jsonData, _ := json.Marshal(reqBody)
-		resp, err := http.Post("http://localhost:8092/add-segment", "application/json", bytes.NewBuffer(jsonData))
-		if err != nil {
-			log.Printf("Failed to add segment %s to origin: %v", segment, err)
-		} else {
-			resp.Body.Close()
-		}
+		})
 	}
 	
 	// Distribute some segments to edge servers
 	edgeServers := []string{"edge-1", "edge-2", "edge-3", "edge-4"}
 	for i, segment := range segments {
 		if i < len(edgeServers) {
-			edgeID := edgeServers[i]
-			reqBody := map[string]string{
-				"nodeId":    edgeID,
+			placements = append(placements, map[string]string{
+				"nodeId":    edgeServers[i],
 				"segmentId": segment,
-			}
-			
-			jsonData, _ := json.Marshal(reqBody)
-			resp, err := http.Post("http://localhost:8092/add-segment", "application/json", bytes.NewBuffer(jsonData))
-			if err != nil {
-				log.Printf("Failed to add segment %s to edge %s: %v", segment, edgeID, err)
-			} else {
-				resp.Body.Close()
-			}
+			})
 		}
 	}
+	
+	jsonData, _ := json.Marshal(placements)
+	resp, err := http.Post("http://localhost:8092/add-segments", "application/json", bytes.NewBuffer(jsonData))
+	if err != nil {
+		log.Printf("Failed to add segments for song %s: %v", songID, err)
+		return
+	}
+	resp.Body.Close()
 }
 
 func corsMiddleware(next http.Handler) http.Handler {
@@ -225,7 +228,10 @@ func main() {
 	r := chi.NewRouter()
 	r.Use(middleware.RequestID)
 	r.Use(middleware.RealIP)
-	r.Use(middleware.Logger)
+	// REQUEST_LOG=0 disables access logs (see DEMO_GUIDE.md)
+	if getenv("REQUEST_LOG", "1") != "0" {
+		r.Use(middleware.Logger)
+	}
 	r.Use(middleware.Recoverer)
 	r.Use(middleware.Timeout(60 * time.Second))
 	r.Use(corsMiddleware)
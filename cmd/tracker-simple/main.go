@@ -5,7 +5,6 @@ import (
 	"log"
 	"net/http"
 	"os"
-	"sort"
 	"strconv"
 	"strings"
 	"sync"
@@ -47,17 +46,21 @@ type PeerInfo struct {
 }
 
 type InMemoryTracker struct {
-	mu      sync.RWMutex
-	peers   map[string]*PeerInfo
-	segments map[string]map[string]bool // segment -> peerId -> true
-	ttl     time.Duration
+	mu           sync.RWMutex
+	peers        map[string]*PeerInfo
+	segments     map[string]map[string]struct{} // segment -> set of peerIds
+	peerSegments map[string]map[string]struct{} // peerId -> set of segments (reverse of segments)
+	ttl          time.Duration
+	ttlSeconds   int64 // ttl in whole seconds, precomputed for cleanup
 }
 
 func NewInMemoryTracker(ttl time.Duration) *InMemoryTracker {
 	t := &InMemoryTracker{
-		peers:    make(map[string]*PeerInfo),
-		segments: make(map[string]map[string]bool),
-		ttl:      ttl,
+		peers:        make(map[string]*PeerInfo),
+		segments:     make(map[string]map[string]struct{}),
+		peerSegments: make(map[string]map[string]struct{}),
+		ttl:          ttl,
+		ttlSeconds:   int64(ttl.Seconds()),
 	}
 	
 	// Start cleanup goroutine
@@ -71,20 +74,23 @@ func (t *InMemoryTracker) cleanup() {
 	defer ticker.Stop()
 	
 	for range ticker.C {
-		now := time.Now().Unix()
+		cutoff := time.Now().Unix() - t.ttlSeconds
 		t.mu.Lock()
 		
 		// Remove expired peers
 		for peerID, peer := range t.peers {
-			if now-peer.LastSeen > int64(t.ttl.Seconds()) {
+			if peer.LastSeen < cutoff {
 				delete(t.peers, peerID)
-				// Remove from segment mappings
-				for segment, peerMap := range t.segments {
+				// Remove from segment mappings, visiting only the segments
+				// this peer announced rather than every known segment
+				for segment := range t.peerSegments[peerID] {
+					peerMap := t.segments[segment]
 					delete(peerMap, peerID)
 					if len(peerMap) == 0 {
 						delete(t.segments, segment)
 					}
 				}
+				delete(t.peerSegments, peerID)
 			}
 		}
 		
@@ -115,15 +121,21 @@ func (t *InMemoryTracker) Announce(peer *AnnounceRequest) {
 	t.peers[peer.PeerID] = peerInfo
 	
 	// Update segment mappings
+	owned := t.peerSegments[peer.PeerID]
+	if owned == nil {
+		owned = make(map[string]struct{})
+		t.peerSegments[peer.PeerID] = owned
+	}
 	for _, segment := range peer.Segments {
 		segment = strings.TrimSpace(segment)
 		if segment == "" {
 			continue
 		}
 		if t.segments[segment] == nil {
-			t.segments[segment] = make(map[string]bool)
+			t.segments[segment] = make(map[string]struct{})
 		}
-		t.segments[segment][peer.PeerID] = true
+		t.segments[segment][peer.PeerID] = struct{}{}
+		owned[segment] = struct{}{}
 	}
 }
 
@@ -136,31 +148,45 @@ func (t *InMemoryTracker) GetPeers(segment string, region string, count int) []P
 		return []PeerInfo{}
 	}
 	
-	peers := make([]PeerInfo, 0, len(peerMap))
-	for peerID := range peerMap {
-		if peer, exists := t.peers[peerID]; exists {
-			peers = append(peers, *peer)
+	// Order by region match (desc), then RTT (asc), then peerID (asc)
+	less := func(a, b *PeerInfo) bool {
+		rim := a.Region == region
+		rjm := b.Region == region
+		if rim != rjm {
+			return rim // Region match sorts first
+		}
+		if a.RTT != b.RTT {
+			return a.RTT < b.RTT
 		}
+		return a.PeerID < b.PeerID
 	}
 	
-	// Sort by region match (desc), then RTT (asc), then peerID (asc)
-	sort.Slice(peers, func(i, j int) bool {
-		rim := boolToInt(peers[i].Region == region)
-		rjm := boolToInt(peers[j].Region == region)
-		if rim != rjm {
-			return rim > rjm
+	// Only the best count peers are returned, so keep a sorted buffer of
+	// that size instead of sorting every holder of the segment. Ranking
+	// pointers means only the returned PeerInfos get copied.
+	peers := make([]*PeerInfo, 0, max(0, min(count, len(peerMap))))
+	for peerID := range peerMap {
+		peer, exists := t.peers[peerID]
+		if !exists {
+			continue
+		}
+		if len(peers) < count {
+			peers = append(peers, peer)
+		} else if len(peers) > 0 && less(peer, peers[len(peers)-1]) {
+			peers[len(peers)-1] = peer
+		} else {
+			continue
 		}
-		if peers[i].RTT != peers[j].RTT {
-			return peers[i].RTT < peers[j].RTT
+		for j := len(peers) - 1; j > 0 && less(peers[j], peers[j-1]); j-- {
+			peers[j], peers[j-1] = peers[j-1], peers[j]
 		}
-		return peers[i].PeerID < peers[j].PeerID
-	})
-	
-	if len(peers) > count {
-		peers = peers[:count]
 	}
 	
-	return peers
+	result := make([]PeerInfo, len(peers))
+	for i, peer := range peers {
+		result[i] = *peer
+	}
+	return result
 }
 
 func main() {
@@ -172,7 +198,10 @@ func main() {
 	r := chi.NewRouter()
 	r.Use(middleware.RequestID)
 	r.Use(middleware.RealIP)
-	r.Use(middleware.Logger)
+	// REQUEST_LOG=0 disables access logs (see DEMO_GUIDE.md)
+	if getenv("REQUEST_LOG", "1") != "0" {
+		r.Use(middleware.Logger)
+	}
 	r.Use(middleware.Recoverer)
 	r.Use(middleware.Timeout(30 * time.Second))
 	r.Use(corsMiddleware)
@@ -232,13 +261,6 @@ func getenvInt(key string, def int) int {
 	return def
 }
 
-func boolToInt(b bool) int {
-	if b {
-		return 1
-	}
-	return 0
-}
-
 // Simple permissive CORS for demo
 func corsMiddleware(next http.Handler) http.Handler {
 	return http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
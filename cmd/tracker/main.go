@@ -40,7 +40,10 @@ func main() {
 	r := chi.NewRouter()
 	r.Use(middleware.RequestID)
 	r.Use(middleware.RealIP)
-	r.Use(middleware.Logger)
+	// REQUEST_LOG=0 disables access logs (see DEMO_GUIDE.md)
+	if getenv("REQUEST_LOG", "1") != "0" {
+		r.Use(middleware.Logger)
+	}
 	r.Use(middleware.Recoverer)
 	r.Use(middleware.Timeout(30 * time.Second))
 	r.Use(corsMiddleware)
@@ -107,28 +110,34 @@ func main() {
 			rtt, _ := strconv.Atoi(h["rtt"])
 			peers = append(peers, PeerInfo{PeerID: id, Region: h["region"], RTT: rtt})
 		}
-		// Simple stable selection
-		sortFunc := func(i, j int) bool {
-			rim := boolToInt(peers[i].Region == region)
-			rjm := boolToInt(peers[j].Region == region)
+		less := func(a, b PeerInfo) bool {
+			rim := boolToInt(a.Region == region)
+			rjm := boolToInt(b.Region == region)
 			if rim != rjm {
 				return rim > rjm
 			}
-			if peers[i].RTT != peers[j].RTT {
-				return peers[i].RTT < peers[j].RTT
+			if a.RTT != b.RTT {
+				return a.RTT < b.RTT
 			}
-			return peers[i].PeerID < peers[j].PeerID
+			return a.PeerID < b.PeerID
 		}
-		for i := 0; i < len(peers); i++ { // insertion sort for simplicity and determinism
-			for j := i; j > 0 && sortFunc(j, j-1); j-- {
-				peers[j], peers[j-1] = peers[j-1], peers[j]
+		// Keep only the best wantCount peers, insertion-sorted as they arrive,
+		// instead of insertion-sorting every peer and truncating afterwards
+		top := make([]PeerInfo, 0, min(wantCount, len(peers)))
+		for _, p := range peers {
+			if len(top) < wantCount {
+				top = append(top, p)
+			} else if less(p, top[len(top)-1]) {
+				top[len(top)-1] = p
+			} else {
+				continue
+			}
+			for j := len(top) - 1; j > 0 && less(top[j], top[j-1]); j-- {
+				top[j], top[j-1] = top[j-1], top[j]
 			}
-		}
-		if len(peers) > wantCount {
-			peers = peers[:wantCount]
 		}
 		w.Header().Set("Content-Type", "application/json")
-		_ = json.NewEncoder(w).Encode(peers)
+		_ = json.NewEncoder(w).Encode(top)
 	})
 
 	log.Printf("tracker listening on %s (redis %s)", httpAddr, redisAddr)
@@ -138,17 +138,29 @@ func queryTracker(trackerURL, segment, region string) []Peer {
 	return peers
 }
 
+type scoredPeer struct {
+	peer  Peer
+	score float64
+}
+
 func rankPeers(peers []Peer, clientRegion string) []Peer {
-	// Create a copy to avoid modifying original
-	rankedPeers := make([]Peer, len(peers))
-	copy(rankedPeers, peers)
-
-	sort.Slice(rankedPeers, func(i, j int) bool {
-		scoreI := calculatePeerScore(rankedPeers[i], clientRegion)
-		scoreJ := calculatePeerScore(rankedPeers[j], clientRegion)
-		return scoreI > scoreJ // Higher score is better
+	// Score every peer once up front; scoring inside the sort comparator
+	// would recompute both scores on each of the O(n log n) comparisons
+	scored := make([]scoredPeer, len(peers))
+	for i, peer := range peers {
+		scored[i] = scoredPeer{peer: peer, score: calculatePeerScore(peer, clientRegion)}
+	}
+
+	sort.Slice(scored, func(i, j int) bool {
+		return scored[i].score > scored[j].score // Higher score is better
 	})
 
+	// Copy out into a new slice to avoid modifying original
+	rankedPeers := make([]Peer, len(scored))
+	for i, sp := range scored {
+		rankedPeers[i] = sp.peer
+	}
+
 	return rankedPeers
 }
 
@@ -181,16 +193,26 @@ func calculatePeerScore(peer Peer, clientRegion string) float64 {
 	return score
 }
 
-func isNearbyRegion(peerRegion, clientRegion string) bool {
-	nearby := map[string][]string{
-		"us-east":      {"us-west", "canada"},
-		"us-west":      {"us-east", "canada"},
-		"eu-west":      {"eu-central"},
-		"eu-central":   {"eu-west"},
-		"asia-pacific": {"asia-southeast", "japan", "australia"},
-	}
+// Region lookup tables are built once at startup instead of on every call
+var nearbyRegions = map[string][]string{
+	"us-east":      {"us-west", "canada"},
+	"us-west":      {"us-east", "canada"},
+	"eu-west":      {"eu-central"},
+	"eu-central":   {"eu-west"},
+	"asia-pacific": {"asia-southeast", "japan", "australia"},
+}
+
+// Simulated edge server RTT by region
+var edgeBaseRTT = map[string]int{
+	"us-east":      25,
+	"us-west":      30,
+	"eu-west":      45,
+	"eu-central":   40,
+	"asia-pacific": 80,
+}
 
-	for _, region := range nearby[clientRegion] {
+func isNearbyRegion(peerRegion, clientRegion string) bool {
+	for _, region := range nearbyRegions[clientRegion] {
 		if region == peerRegion {
 			return true
 		}
@@ -209,15 +231,7 @@ func checkEdgeCache(edgeURL, segment string) bool {
 
 func estimateEdgeRTT(region string) int {
 	// Simulate edge server RTT based on region
-	baseRTT := map[string]int{
-		"us-east":      25,
-		"us-west":      30,
-		"eu-west":      45,
-		"eu-central":   40,
-		"asia-pacific": 80,
-	}
-
-	if rtt, exists := baseRTT[region]; exists {
+	if rtt, exists := edgeBaseRTT[region]; exists {
 		return rtt + rand.Intn(10) // Add some variance
 	}
 	return 60 + rand.Intn(20)
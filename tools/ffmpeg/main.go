@@ -1,15 +1,19 @@
 package main
 
 import (
+	"bufio"
+	"bytes"
 	"context"
 	"crypto/sha256"
 	"encoding/hex"
 	"encoding/json"
 	"fmt"
+	"io"
 	"os"
 	"os/exec"
 	"path/filepath"
 	"strings"
+	"sync"
 )
 
 type Checksum struct {
@@ -17,20 +21,58 @@ type Checksum struct {
 	SHA256 string `json:"sha256"`
 }
 
-func run(cmd string, args ...string) error {
+// run executes cmd with both of its output streams sent to out
+func run(out io.Writer, cmd string, args ...string) error {
 	c := exec.CommandContext(context.Background(), cmd, args...)
-	c.Stdout = os.Stdout
-	c.Stderr = os.Stderr
+	c.Stdout = out
+	c.Stderr = out
 	return c.Run()
 }
 
+// hashFile streams path through SHA-256, so large video inputs are never
+// held in memory whole
 func hashFile(path string) (string, error) {
-	data, err := os.ReadFile(path)
+	f, err := os.Open(path)
 	if err != nil {
 		return "", err
 	}
-	sum := sha256.Sum256(data)
-	return hex.EncodeToString(sum[:]), nil
+	defer f.Close()
+
+	h := sha256.New()
+	if _, err := io.Copy(h, f); err != nil {
+		return "", err
+	}
+	return hex.EncodeToString(h.Sum(nil)), nil
+}
+
+// upToDate reports whether outDir still holds a complete ladder for the
+// given bitrates: the master playlist, every variant playlist, and every
+// file recorded in checksums.json with its recorded hash.
+func upToDate(outDir string, bitrates []string) bool {
+	if _, err := os.Stat(filepath.Join(outDir, "master.m3u8")); err != nil {
+		return false
+	}
+	for _, br := range bitrates {
+		if _, err := os.Stat(filepath.Join(outDir, br, "index.m3u8")); err != nil {
+			return false
+		}
+	}
+
+	data, err := os.ReadFile(filepath.Join(outDir, "checksums.json"))
+	if err != nil {
+		return false
+	}
+	var checksums []Checksum
+	if err := json.Unmarshal(data, &checksums); err != nil {
+		return false
+	}
+	for _, c := range checksums {
+		sum, err := hashFile(filepath.Join(outDir, c.Path))
+		if err != nil || sum != c.SHA256 {
+			return false
+		}
+	}
+	return true
 }
 
 // This tool expects ffmpeg installed on PATH.
@@ -48,82 +90,171 @@ func main() {
 	}
 	in := os.Args[1]
 	outDir := os.Args[2]
-	bitrates := strings.Split(os.Args[3], ",")
+	// Trim and drop repeated bitrates: each one is encoded concurrently
+	// into its own directory, so a duplicate would race with itself
+	var bitrates []string
+	seen := make(map[string]bool)
+	for _, br := range strings.Split(os.Args[3], ",") {
+		br = strings.TrimSpace(br)
+		if !seen[br] {
+			seen[br] = true
+			bitrates = append(bitrates, br)
+		}
+	}
 
 	if err := os.MkdirAll(outDir, 0o755); err != nil {
 		fmt.Fprintln(os.Stderr, err)
 		os.Exit(1)
 	}
 
-	checksums := make([]Checksum, 0, 128)
+	// Skip the whole ladder when this exact input was already packaged
+	// with the same bitrates; re-running ffmpeg is by far the slowest step
+	inSum, err := hashFile(in)
+	if err != nil {
+		fmt.Fprintln(os.Stderr, err)
+		os.Exit(1)
+	}
+	stampPath := filepath.Join(outDir, ".source.sha256")
+	stamp := inSum + " " + os.Args[3] + "\n"
+	if prev, err := os.ReadFile(stampPath); err == nil && string(prev) == stamp && upToDate(outDir, bitrates) {
+		fmt.Printf("%s is up to date, skipping\n", outDir)
+		return
+	}
 
-	// For each bitrate, create HLS ladder directory and segments
-	for _, br := range bitrates {
-		br = strings.TrimSpace(br)
-		variantDir := filepath.Join(outDir, br)
-		if err := os.MkdirAll(variantDir, 0o755); err != nil {
-			fmt.Fprintln(os.Stderr, err)
-			os.Exit(1)
-		}
-		// Produce HLS segments: 2s segments, fMP4
-		// master.m3u8 will be assembled later; here we produce variant playlist
-		// Example ffmpeg command for fMP4 HLS:
-		// ffmpeg -i in -c:a aac -b:a 128k -hls_time 2 -hls_playlist_type vod \
-		//   -hls_segment_type fmp4 -master_pl_name master.m3u8 -var_stream_map "a:0,name:audio" \
-		//   -f hls 128k/index.m3u8
-		variantIndex := filepath.Join(variantDir, "index.m3u8")
-		args := []string{
-			"-y",
-			"-i", in,
-			"-c:a", "aac",
-			"-b:a", br,
-			"-hls_time", "2",
-			"-hls_playlist_type", "vod",
-			"-hls_segment_type", "fmp4",
-			"-f", "hls",
-			variantIndex,
-		}
-		if err := run("ffmpeg", args...); err != nil {
-			fmt.Fprintf(os.Stderr, "ffmpeg failed for %s: %v\n", br, err)
-			os.Exit(1)
-		}
+	// Each rendition is an independent ffmpeg run, so encode them
+	// concurrently. Output and checksums are collected per variant and
+	// emitted in bitrate order, so logs don't interleave and
+	// checksums.json stays stable between runs.
+	variantSums := make([][]Checksum, len(bitrates))
+	variantLogs := make([]bytes.Buffer, len(bitrates))
+	errs := make([]error, len(bitrates))
+	var wg sync.WaitGroup
+	for i, br := range bitrates {
+		wg.Add(1)
+		go func(i int, br string) {
+			defer wg.Done()
+			variantSums[i], errs[i] = packageVariant(&variantLogs[i], in, outDir, br)
+		}(i, br)
+	}
+	wg.Wait()
 
-		// Hash all files in variantDir
-		if err := filepath.WalkDir(variantDir, func(path string, d os.DirEntry, err error) error {
-			if err != nil {
-				return err
-			}
-			if d.IsDir() {
-				return nil
-			}
-			sum, err := hashFile(path)
-			if err != nil {
-				return err
-			}
-			rel, _ := filepath.Rel(outDir, path)
-			checksums = append(checksums, Checksum{Path: rel, SHA256: sum})
-			return nil
-		}); err != nil {
-			fmt.Fprintf(os.Stderr, "hash walk failed for %s: %v\n", br, err)
+	checksums := make([]Checksum, 0, 128)
+	for i, br := range bitrates {
+		fmt.Printf("==> %s\n", br)
+		variantLogs[i].WriteTo(os.Stdout)
+		if errs[i] != nil {
+			fmt.Fprintln(os.Stderr, errs[i])
 			os.Exit(1)
 		}
+		checksums = append(checksums, variantSums[i]...)
 	}
 
 	// Write master playlist that references all variants by bitrate directory
-	master := "#EXTM3U\n"
+	var master strings.Builder
+	master.WriteString("#EXTM3U\n")
 	for _, br := range bitrates {
-		br = strings.TrimSpace(br)
-		master += fmt.Sprintf("#EXT-X-STREAM-INF:BANDWIDTH=%s\n%s/index.m3u8\n", strings.TrimSuffix(br, "k")+"000", br)
+		fmt.Fprintf(&master, "#EXT-X-STREAM-INF:BANDWIDTH=%s\n%s/index.m3u8\n", strings.TrimSuffix(br, "k")+"000", br)
 	}
-	if err := os.WriteFile(filepath.Join(outDir, "master.m3u8"), []byte(master), 0o644); err != nil {
+	if err := os.WriteFile(filepath.Join(outDir, "master.m3u8"), []byte(master.String()), 0o644); err != nil {
 		fmt.Fprintln(os.Stderr, err)
 		os.Exit(1)
 	}
 
 	// Write checksums
-	b, _ := json.MarshalIndent(checksums, "", "  ")
-	if err := os.WriteFile(filepath.Join(outDir, "checksums.json"), b, 0o644); err != nil {
+	if err := writeJSON(filepath.Join(outDir, "checksums.json"), checksums); err != nil {
 		fmt.Fprintln(os.Stderr, err)
 		os.Exit(1)
 	}
+
+	// Record what was packaged so the next run can skip unchanged input
+	if err := os.WriteFile(stampPath, []byte(stamp), 0o644); err != nil {
+		fmt.Fprintln(os.Stderr, err)
+		os.Exit(1)
+	}
+}
+
+// packageVariant creates the HLS ladder directory and segments for one
+// bitrate and returns the checksums of the files it produced. ffmpeg's
+// output is written to log.
+func packageVariant(log io.Writer, in, outDir, br string) ([]Checksum, error) {
+	variantDir := filepath.Join(outDir, br)
+	if err := os.MkdirAll(variantDir, 0o755); err != nil {
+		return nil, err
+	}
+	// Produce HLS segments: 2s segments, fMP4
+	// master.m3u8 will be assembled later; here we produce variant playlist
+	// Example ffmpeg command for fMP4 HLS:
+	// ffmpeg -i in -c:a aac -b:a 128k -hls_time 2 -hls_playlist_type vod \
+	//   -hls_segment_type fmp4 -master_pl_name master.m3u8 -var_stream_map "a:0,name:audio" \
+	//   -f hls 128k/index.m3u8
+	variantIndex := filepath.Join(variantDir, "index.m3u8")
+	args := []string{
+		"-y",
+		"-i", in,
+		"-c:a", "aac",
+		"-b:a", br,
+		"-hls_time", "2",
+		"-hls_playlist_type", "vod",
+		"-hls_segment_type", "fmp4",
+		"-f", "hls",
+		variantIndex,
+	}
+	if err := run(log, "ffmpeg", args...); err != nil {
+		return nil, fmt.Errorf("ffmpeg failed for %s: %v", br, err)
+	}
+
+	// Hash all files in variantDir
+	var checksums []Checksum
+	if err := filepath.WalkDir(variantDir, func(path string, d os.DirEntry, err error) error {
+		if err != nil {
+			return err
+		}
+		if d.IsDir() {
+			return nil
+		}
+		sum, err := hashFile(path)
+		if err != nil {
+			return err
+		}
+		rel, _ := filepath.Rel(outDir, path)
+		checksums = append(checksums, Checksum{Path: rel, SHA256: sum})
+		return nil
+	}); err != nil {
+		return nil, fmt.Errorf("hash walk failed for %s: %v", br, err)
+	}
+	return checksums, nil
+}
+
+// writeJSON encodes v as indented JSON straight into a buffered file. The
+// output goes to a temporary file in the same directory that is renamed
+// over path once complete, so an interrupted run never leaves a truncated
+// file behind.
+func writeJSON(path string, v any) (err error) {
+	f, err := os.CreateTemp(filepath.Dir(path), filepath.Base(path)+".*.tmp")
+	if err != nil {
+		return err
+	}
+	defer func() {
+		if err != nil {
+			f.Close()
+			os.Remove(f.Name())
+		}
+	}()
+
+	w := bufio.NewWriterSize(f, 64<<10)
+	enc := json.NewEncoder(w)
+	enc.SetIndent("", "  ")
+	if err := enc.Encode(v); err != nil {
+		return err
+	}
+	if err := w.Flush(); err != nil {
+		return err
+	}
+	if err := f.Chmod(0o644); err != nil {
+		return err
+	}
+	if err := f.Close(); err != nil {
+		return err
+	}
+	return os.Rename(f.Name(), path)
 }
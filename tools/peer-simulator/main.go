@@ -9,10 +9,14 @@ import (
 	"net/http"
 	"os"
 	"strconv"
+	"strings"
 	"sync"
 	"time"
 )
 
+// registerWorkers bounds how many peers are registered concurrently
+const registerWorkers = 8
+
 // PeerContainer represents a simulated mobile device
 type PeerContainer struct {
 	ID           string            `json:"id"`
@@ -47,6 +51,7 @@ type PeerResponse struct {
 
 type PeerSimulator struct {
 	peers        []*PeerContainer
+	peersByID    map[string]*PeerContainer // Index over peers for findPeer
 	networkAPI   string
 	trackerAPI   string
 	mu           sync.RWMutex
@@ -58,6 +63,7 @@ func NewPeerSimulator(networkAPI, trackerAPI string) *PeerSimulator {
 		networkAPI: networkAPI,
 		trackerAPI: trackerAPI,
 		peers:      make([]*PeerContainer, 0),
+		peersByID:  make(map[string]*PeerContainer),
 	}
 }
 
@@ -103,6 +109,7 @@ func (ps *PeerSimulator) CreatePeers(count int) {
 		}
 		
 		ps.peers = append(ps.peers, peer)
+		ps.peersByID[peer.ID] = peer
 	}
 	
 	// Create P2P connections
@@ -111,6 +118,28 @@ func (ps *PeerSimulator) CreatePeers(count int) {
 	fmt.Printf("✅ Created %d peer containers\n", len(ps.peers))
 }
 
+// meshLinks is the set of connected peer pairs, keyed by sorted IDs
+type meshLinks map[[2]string]struct{}
+
+func linkKey(a, b string) [2]string {
+	if a > b {
+		a, b = b, a
+	}
+	return [2]string{a, b}
+}
+
+func (l meshLinks) has(a, b string) bool {
+	_, ok := l[linkKey(a, b)]
+	return ok
+}
+
+// connect links two peers both ways and records the pair
+func (l meshLinks) connect(a, b *PeerContainer) {
+	a.Connections = append(a.Connections, b.ID)
+	b.Connections = append(b.Connections, a.ID)
+	l[linkKey(a.ID, b.ID)] = struct{}{}
+}
+
 func (ps *PeerSimulator) createP2PConnections() {
 	fmt.Println("🕸️  Creating P2P mesh connections...")
 	
@@ -118,6 +147,10 @@ func (ps *PeerSimulator) createP2PConnections() {
 	edgeConnections := 0
 	maxEdgeConnections := 4
 	
+	// Track existing links so a pair seen from both sides is not linked
+	// twice
+	links := make(meshLinks)
+	
 	for _, peer := range ps.peers {
 		// 6% chance to connect to edge server
 		if rand.Float64() < 0.06 && edgeConnections < maxEdgeConnections {
@@ -130,7 +163,7 @@ func (ps *PeerSimulator) createP2PConnections() {
 		connected := 0
 		
 		for _, otherPeer := range ps.peers {
-			if otherPeer.ID != peer.ID && connected < peerConnections {
+			if otherPeer.ID != peer.ID && connected < peerConnections && !links.has(peer.ID, otherPeer.ID) {
 				// Higher chance to connect to peers in same region
 				connectProb := 0.3
 				if peer.Region == otherPeer.Region {
@@ -138,8 +171,7 @@ func (ps *PeerSimulator) createP2PConnections() {
 				}
 				
 				if rand.Float64() < connectProb {
-					peer.Connections = append(peer.Connections, otherPeer.ID)
-					otherPeer.Connections = append(otherPeer.Connections, peer.ID)
+					links.connect(peer, otherPeer)
 					connected++
 				}
 			}
@@ -168,30 +200,60 @@ func (ps *PeerSimulator) StartSimulation() {
 func (ps *PeerSimulator) registerPeers() {
 	fmt.Println("📡 Registering peers with network topology...")
 	
+	// Each peer's registration is independent, so spread them over a few
+	// workers instead of waiting on every round trip in turn
+	jobs := make(chan *PeerContainer, registerWorkers)
+	var wg sync.WaitGroup
+	for w := 0; w < registerWorkers; w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for peer := range jobs {
+				ps.registerPeer(peer)
+			}
+		}()
+	}
+	
 	for _, peer := range ps.peers {
-		// Register peer with network topology
-		peerData := map[string]interface{}{
-			"id":       peer.ID,
-			"type":     "peer",
-			"region":   peer.Region,
-			"storage":  peer.Storage,
-			"memory":   peer.Memory,
-			"maxMemory": peer.MaxMemory,
-			"isOnline": peer.IsOnline,
-		}
-		
-		jsonData, _ := json.Marshal(peerData)
-		http.Post(ps.networkAPI+"/add-peer", "application/json", bytes.NewBuffer(jsonData))
-		
-		// Register segments with tracker
-		for segmentID := range peer.Storage {
-			ps.registerSegment(peer.ID, segmentID)
-		}
+		jobs <- peer
 	}
+	close(jobs)
+	wg.Wait()
 	
 	fmt.Println("✅ All peers registered")
 }
 
+func (ps *PeerSimulator) registerPeer(peer *PeerContainer) {
+	// Register peer with network topology
+	peerData := map[string]interface{}{
+		"id":       peer.ID,
+		"type":     "peer",
+		"region":   peer.Region,
+		"storage":  peer.Storage,
+		"memory":   peer.Memory,
+		"maxMemory": peer.MaxMemory,
+		"isOnline": peer.IsOnline,
+	}
+	
+	jsonData, _ := json.Marshal(peerData)
+	if resp, err := http.Post(ps.networkAPI+"/add-peer", "application/json", bytes.NewBuffer(jsonData)); err == nil {
+		resp.Body.Close()
+	}
+	
+	// Register segments with tracker, all of this peer's in one request
+	segments := make([]map[string]string, 0, len(peer.Storage))
+	for segmentID := range peer.Storage {
+		segments = append(segments, map[string]string{
+			"nodeId":    peer.ID,
+			"segmentId": segmentID,
+		})
+	}
+	jsonData, _ = json.Marshal(segments)
+	if resp, err := http.Post(ps.networkAPI+"/add-segments", "application/json", bytes.NewBuffer(jsonData)); err == nil {
+		resp.Body.Close()
+	}
+}
+
 func (ps *PeerSimulator) registerSegment(peerID, segmentID string) {
 	segmentData := map[string]string{
 		"nodeId":    peerID,
@@ -199,7 +261,10 @@ func (ps *PeerSimulator) registerSegment(peerID, segmentID string) {
 	}
 	
 	jsonData, _ := json.Marshal(segmentData)
-	http.Post(ps.networkAPI+"/add-segment", "application/json", bytes.NewBuffer(jsonData))
+	// Close the body so the connection can be reused by the next call
+	if resp, err := http.Post(ps.networkAPI+"/add-segment", "application/json", bytes.NewBuffer(jsonData)); err == nil {
+		resp.Body.Close()
+	}
 }
 
 func (ps *PeerSimulator) simulateRequests() {
@@ -237,19 +302,23 @@ func (ps *PeerSimulator) makeRequest(peer *PeerContainer, segmentID string) {
 	ps.requestCount++
 	ps.mu.Unlock()
 	
+	// Check both segment formats for the requested segment. The
+	// alternative name only depends on segmentID, so derive it once rather
+	// than re-parsing it for every connected peer.
+	// Extract segment number from segmentID (e.g., "segment003.ts" -> 3)
+	// Other IDs have no alias, so only the exact segmentID is checked
+	var songIDCheck string
+	if len(segmentID) >= 12 && strings.HasPrefix(segmentID, "segment") {
+		var segmentNum int
+		fmt.Sscanf(segmentID, "segment%03d.ts", &segmentNum)
+		songIDCheck = fmt.Sprintf("song_%03d", segmentNum)
+	}
+	
 	// First try P2P - check connected peers
 	for _, connectedPeerID := range peer.Connections {
 		connectedPeer := ps.findPeer(connectedPeerID)
 		if connectedPeer != nil {
-			// Check both segment formats for the requested segment
-			// Extract segment number from segmentID (e.g., "segment003.ts" -> 3)
-			var segmentNum int
-			if len(segmentID) >= 12 && segmentID[:8] == "segment" {
-				fmt.Sscanf(segmentID, "segment%03d.ts", &segmentNum)
-			}
-			songIDCheck := fmt.Sprintf("song_%03d", segmentNum)
-			
-			if connectedPeer.Storage[segmentID] || connectedPeer.Storage[songIDCheck] {
+			if connectedPeer.Storage[segmentID] || (songIDCheck != "" && connectedPeer.Storage[songIDCheck]) {
 				// Found in P2P network
 				peer.Storage[segmentID] = true
 				peer.Memory += 5000000 // 5MB per segment
@@ -314,12 +383,7 @@ func (ps *PeerSimulator) makeRequest(peer *PeerContainer, segmentID string) {
 }
 
 func (ps *PeerSimulator) findPeer(peerID string) *PeerContainer {
-	for _, peer := range ps.peers {
-		if peer.ID == peerID {
-			return peer
-		}
-	}
-	return nil
+	return ps.peersByID[peerID]
 }
 
 func (ps *PeerSimulator) evictOldestSegment(peer *PeerContainer) {
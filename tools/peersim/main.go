@@ -8,9 +8,14 @@ import (
 	"net/http"
 	"os"
 	"strconv"
+	"sync"
+	"sync/atomic"
 	"time"
 )
 
+// registerWorkers bounds how many announce requests are in flight at once
+const registerWorkers = 8
+
 type PeerData struct {
 	PeerID       string   `json:"peerId"`
 	Addr         string   `json:"addr"`
@@ -63,8 +68,29 @@ func main() {
 	fmt.Printf("🚀 Simulating %d peers for Rick Roll CDN...\n", peerCount)
 	fmt.Println("📡 Registering peers with tracker...")
 
-	successCount := 0
-	errorCount := 0
+	var successCount, errorCount atomic.Int64
+
+	// Registrations are independent, so hand them to a fixed set of
+	// workers instead of waiting on each HTTP round trip in turn
+	jobs := make(chan PeerData, registerWorkers)
+	var wg sync.WaitGroup
+	for w := 0; w < registerWorkers; w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for peer := range jobs {
+				if err := registerPeer(trackerURL, peer); err == nil {
+					if n := successCount.Add(1); n%200 == 0 {
+						fmt.Printf("✅ Registered %d peers...\n", n)
+					}
+				} else {
+					if n := errorCount.Add(1); n%100 == 0 {
+						fmt.Printf("⚠️  %d registration errors so far...\n", n)
+					}
+				}
+			}
+		}()
+	}
 
 	for i := 1; i <= peerCount; i++ {
 		// Random peer characteristics
@@ -95,17 +121,7 @@ func main() {
 				Availability: bandwidth.availability,
 			}
 
-			if err := registerPeer(trackerURL, peer); err == nil {
-				successCount++
-				if successCount%200 == 0 {
-					fmt.Printf("✅ Registered %d peers...\n", successCount)
-				}
-			} else {
-				errorCount++
-				if errorCount%100 == 0 {
-					fmt.Printf("⚠️  %d registration errors so far...\n", errorCount)
-				}
-			}
+			jobs <- peer
 		}
 
 		// Small delay to avoid overwhelming the tracker
@@ -113,11 +129,13 @@ func main() {
 			time.Sleep(50 * time.Millisecond)
 		}
 	}
+	close(jobs)
+	wg.Wait()
 
 	fmt.Println()
 	fmt.Println("🎉 Peer Registration Complete!")
-	fmt.Printf("✅ Successfully registered: %d peers\n", successCount)
-	fmt.Printf("❌ Registration errors: %d\n", errorCount)
+	fmt.Printf("✅ Successfully registered: %d peers\n", successCount.Load())
+	fmt.Printf("❌ Registration errors: %d\n", errorCount.Load())
 	fmt.Println()
 
 	// Test peer distribution
@@ -168,7 +186,9 @@ func queryPeerCount(trackerURL, segment, region string) int {
 	}
 	defer resp.Body.Close()
 
-	var peers []interface{}
+	// Only the number of entries matters here, so keep each element as raw
+	// bytes instead of decoding it into a map[string]interface{}.
+	var peers []json.RawMessage
 	if err := json.NewDecoder(resp.Body).Decode(&peers); err != nil {
 		return 0
 	}
@@ -523,6 +523,28 @@ func max(a, b int) int {
 	return b
 }
 
+// meshLinks is the set of connected peer pairs, keyed by sorted IDs
+type meshLinks map[[2]string]struct{}
+
+func linkKey(a, b string) [2]string {
+	if a > b {
+		a, b = b, a
+	}
+	return [2]string{a, b}
+}
+
+func (l meshLinks) has(a, b string) bool {
+	_, ok := l[linkKey(a, b)]
+	return ok
+}
+
+// connect links two peers both ways and records the pair
+func (l meshLinks) connect(a, b *PeerContainer) {
+	a.ConnectedPeers = append(a.ConnectedPeers, b.ID)
+	b.ConnectedPeers = append(b.ConnectedPeers, a.ID)
+	l[linkKey(a.ID, b.ID)] = struct{}{}
+}
+
 // createP2PMesh creates realistic P2P connections between peers
 func createP2PMesh(peers []*PeerContainer) {
 	fmt.Printf("   🔗 Connecting peers in realistic P2P mesh...\n")
@@ -539,6 +561,10 @@ func createP2PMesh(peers []*PeerContainer) {
 		}
 	}
 	
+	// Track existing links in a set rather than scanning ConnectedPeers,
+	// which grows large for seed peers
+	links := make(meshLinks)
+	
 	fmt.Printf("   🌱 %d seed peers will connect to edge servers\n", len(seedPeers))
 	fmt.Printf("   👥 %d regular peers will connect to other peers\n", len(regularPeers))
 	
@@ -550,8 +576,7 @@ func createP2PMesh(peers []*PeerContainer) {
 		if len(seedPeers) > 0 && connectionsNeeded > 0 {
 			seedPeer := seedPeers[rand.Intn(len(seedPeers))]
 			if canConnect(peer, seedPeer) {
-				peer.ConnectedPeers = append(peer.ConnectedPeers, seedPeer.ID)
-				seedPeer.ConnectedPeers = append(seedPeer.ConnectedPeers, peer.ID)
+				links.connect(peer, seedPeer)
 				connectionsNeeded--
 			}
 		}
@@ -560,7 +585,10 @@ func createP2PMesh(peers []*PeerContainer) {
 		attempts := 0
 		maxAttempts := len(regularPeers) * 2
 		
-		for connectionsNeeded > 0 && attempts < maxAttempts {
+		// Links made by earlier peers also count against MaxConnections, so
+		// stop as soon as this peer is full: canConnect would reject every
+		// remaining attempt
+		for connectionsNeeded > 0 && attempts < maxAttempts && len(peer.ConnectedPeers) < peer.MaxConnections {
 			attempts++
 			targetPeer := regularPeers[rand.Intn(len(regularPeers))]
 			
@@ -568,30 +596,20 @@ func createP2PMesh(peers []*PeerContainer) {
 				continue // Don't connect to self
 			}
 			
-			// Check if already connected
-			alreadyConnected := false
-			for _, connectedID := range peer.ConnectedPeers {
-				if connectedID == targetPeer.ID {
-					alreadyConnected = true
-					break
-				}
-			}
+			alreadyConnected := links.has(peer.ID, targetPeer.ID)
 			
 			if !alreadyConnected && canConnect(peer, targetPeer) {
-				// Prefer peers in same region (80% chance) or nearby regions
-				regionMatch := peer.Region == targetPeer.Region
-				nearbyRegion := areRegionsNearby(peer.Region, targetPeer.Region)
-				
+				// Prefer peers in same region (80% chance) or nearby regions;
+				// the nearby lookup is only needed when the regions differ
 				connectProbability := 0.3 // Base probability
-				if regionMatch {
+				if peer.Region == targetPeer.Region {
 					connectProbability = 0.8
-				} else if nearbyRegion {
+				} else if areRegionsNearby(peer.Region, targetPeer.Region) {
 					connectProbability = 0.5
 				}
 				
 				if rand.Float64() < connectProbability {
-					peer.ConnectedPeers = append(peer.ConnectedPeers, targetPeer.ID)
-					targetPeer.ConnectedPeers = append(targetPeer.ConnectedPeers, peer.ID)
+					links.connect(peer, targetPeer)
 					connectionsNeeded--
 				}
 			}
@@ -604,18 +622,10 @@ func createP2PMesh(peers []*PeerContainer) {
 		
 		for j, otherSeed := range seedPeers {
 			if i != j && connectionsNeeded > 0 && canConnect(seedPeer, otherSeed) {
-				// Check if already connected
-				alreadyConnected := false
-				for _, connectedID := range seedPeer.ConnectedPeers {
-					if connectedID == otherSeed.ID {
-						alreadyConnected = true
-						break
-					}
-				}
+				alreadyConnected := links.has(seedPeer.ID, otherSeed.ID)
 				
 				if !alreadyConnected {
-					seedPeer.ConnectedPeers = append(seedPeer.ConnectedPeers, otherSeed.ID)
-					otherSeed.ConnectedPeers = append(otherSeed.ConnectedPeers, seedPeer.ID)
+					links.connect(seedPeer, otherSeed)
 					connectionsNeeded--
 				}
 			}
@@ -630,7 +640,11 @@ func createP2PMesh(peers []*PeerContainer) {
 	totalConnections /= 2 // Each connection is counted twice
 	
 	fmt.Printf("   ✅ P2P mesh created: %d total connections\n", totalConnections)
-	fmt.Printf("   📊 Average connections per peer: %.1f\n", float64(totalConnections*2)/float64(len(peers)))
+	avgConnections := 0.0
+	if len(peers) > 0 {
+		avgConnections = float64(totalConnections*2) / float64(len(peers))
+	}
+	fmt.Printf("   📊 Average connections per peer: %.1f\n", avgConnections)
 }
 
 func canConnect(peer1, peer2 *PeerContainer) bool {
@@ -638,24 +652,26 @@ func canConnect(peer1, peer2 *PeerContainer) bool {
 		   len(peer2.ConnectedPeers) < peer2.MaxConnections
 }
 
+// nearbyRegions is built once rather than on every areRegionsNearby call,
+// which runs inside the mesh construction loop
+var nearbyRegions = map[string][]string{
+	"us-east":         {"us-central", "us-west", "canada"},
+	"us-west":         {"us-central", "us-east"},
+	"us-central":      {"us-east", "us-west", "canada"},
+	"eu-west":         {"eu-central", "eu-north"},
+	"eu-central":      {"eu-west", "eu-north"},
+	"eu-north":        {"eu-west", "eu-central"},
+	"asia-pacific":    {"asia-southeast", "asia-northeast", "australia"},
+	"asia-southeast":  {"asia-pacific", "asia-northeast"},
+	"asia-northeast":  {"asia-pacific", "asia-southeast", "japan"},
+	"canada":          {"us-east", "us-central"},
+	"australia":       {"asia-pacific"},
+	"japan":           {"asia-northeast"},
+	"brazil":          {},
+	"india":           {"asia-southeast"},
+}
+
 func areRegionsNearby(region1, region2 string) bool {
-	nearbyRegions := map[string][]string{
-		"us-east":         {"us-central", "us-west", "canada"},
-		"us-west":         {"us-central", "us-east"},
-		"us-central":      {"us-east", "us-west", "canada"},
-		"eu-west":         {"eu-central", "eu-north"},
-		"eu-central":      {"eu-west", "eu-north"},
-		"eu-north":        {"eu-west", "eu-central"},
-		"asia-pacific":    {"asia-southeast", "asia-northeast", "australia"},
-		"asia-southeast":  {"asia-pacific", "asia-northeast"},
-		"asia-northeast":  {"asia-pacific", "asia-southeast", "japan"},
-		"canada":          {"us-east", "us-central"},
-		"australia":       {"asia-pacific"},
-		"japan":           {"asia-northeast"},
-		"brazil":          {},
-		"india":           {"asia-southeast"},
-	}
-	
 	if nearby, exists := nearbyRegions[region1]; exists {
 		for _, region := range nearby {
 			if region == region2 {
@@ -7,6 +7,7 @@ import (
 	"log"
 	"os"
 	"path/filepath"
+	"strings"
 
 	minio "github.com/minio/minio-go/v7"
 	"github.com/minio/minio-go/v7/pkg/credentials"
@@ -46,7 +47,9 @@ func main() {
 		if err != nil {
 			return err
 		}
-		if d.IsDir() {
+		// Skip directories and local bookkeeping dotfiles (such as the
+		// packager's .source.sha256 stamp); only media is published
+		if d.IsDir() || strings.HasPrefix(d.Name(), ".") {
 			return nil
 		}
 		rel, _ := filepath.Rel(*inDir, path)
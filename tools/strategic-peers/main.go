@@ -9,9 +9,13 @@ import (
 	"os"
 	"strconv"
 	"sync"
+	"sync/atomic"
 	"time"
 )
 
+// registerWorkers bounds how many registrations are in flight at once
+const registerWorkers = 8
+
 type PeerContainer struct {
 	ID             string   `json:"peerId"`
 	Region         string   `json:"region"`
@@ -113,6 +117,17 @@ func main() {
 		0.00, // segment004.ts - No P2P availability (Edge/Origin only)
 	}
 
+	// Use a dedicated, seedable source so a peer population and mesh can
+	// be reproduced with PEER_SEED instead of drawing from the global one
+	seed := time.Now().UnixNano()
+	if v := os.Getenv("PEER_SEED"); v != "" {
+		if n, err := strconv.ParseInt(v, 10, 64); err == nil {
+			seed = n
+		}
+	}
+	fmt.Printf("🎲 Peer seed: %d\n", seed)
+	rng := rand.New(rand.NewSource(seed))
+
 	var peers []*PeerContainer
 	seedPeerCount := max(1, peerCount/15) // ~7% are seed peers
 
@@ -121,10 +136,10 @@ func main() {
 
 	// Create peers with strategic segment distribution
 	for i := 1; i <= peerCount; i++ {
-		region := regions[rand.Intn(len(regions))]
-		deviceType := deviceTypes[rand.Intn(len(deviceTypes))]
-		bandwidth := bandwidthTiers[rand.Intn(len(bandwidthTiers))]
-		rtt := rand.Intn(bandwidth.rttRange[1]-bandwidth.rttRange[0]) + bandwidth.rttRange[0]
+		region := regions[rng.Intn(len(regions))]
+		deviceType := deviceTypes[rng.Intn(len(deviceTypes))]
+		bandwidth := bandwidthTiers[rng.Intn(len(bandwidthTiers))]
+		rtt := rng.Intn(bandwidth.rttRange[1]-bandwidth.rttRange[0]) + bandwidth.rttRange[0]
 
 		peer := &PeerContainer{
 			ID:             fmt.Sprintf("peer-%s-%s-%s-%d", region, deviceType, bandwidth.tier, i),
@@ -142,41 +157,43 @@ func main() {
 			Segments:       make([]string, 0),
 		}
 
+		// Adjust based on device type for realism. The multipliers depend
+		// only on the peer, so resolve them once rather than per segment
+		deviceFactor := 1.0
+		switch deviceType {
+		case "smartphone":
+			deviceFactor = 0.8 // Phones have less storage
+		case "tablet":
+			deviceFactor = 0.9
+		case "laptop":
+			deviceFactor = 1.0
+		case "desktop":
+			deviceFactor = 1.1 // Desktops store more
+		}
+
+		// High bandwidth users are more likely to have segments
+		tierFactor := 1.0
+		switch bandwidth.tier {
+		case "fiber":
+			tierFactor = 1.2
+		case "cable":
+			tierFactor = 1.1
+		case "4g":
+			tierFactor = 0.9
+		case "3g":
+			tierFactor = 0.7
+		}
+
 		// Strategic segment assignment
 		for segIdx, segment := range segments {
-			baseProbability := segmentProbabilities[segIdx]
-
-			// Adjust based on device type for realism
-			adjustedProbability := baseProbability
-			switch deviceType {
-			case "smartphone":
-				adjustedProbability *= 0.8 // Phones have less storage
-			case "tablet":
-				adjustedProbability *= 0.9
-			case "laptop":
-				adjustedProbability *= 1.0
-			case "desktop":
-				adjustedProbability *= 1.1 // Desktops store more
-			}
-
-			// High bandwidth users are more likely to have segments
-			switch bandwidth.tier {
-			case "fiber":
-				adjustedProbability *= 1.2
-			case "cable":
-				adjustedProbability *= 1.1
-			case "4g":
-				adjustedProbability *= 0.9
-			case "3g":
-				adjustedProbability *= 0.7
-			}
+			adjustedProbability := segmentProbabilities[segIdx] * deviceFactor * tierFactor
 
 			// Ensure probability doesn't exceed 1.0
 			if adjustedProbability > 1.0 {
 				adjustedProbability = 1.0
 			}
 
-			if rand.Float64() < adjustedProbability {
+			if rng.Float64() < adjustedProbability {
 				peer.Segments = append(peer.Segments, segment)
 			}
 		}
@@ -186,58 +203,72 @@ func main() {
 
 	// Create P2P mesh topology
 	fmt.Println("🕸️  Creating P2P mesh topology...")
-	createP2PMesh(peers)
+	createP2PMesh(peers, rng)
 
 	// Register peers with tracker
 	fmt.Printf("📡 Registering %d peers with tracker...\n", len(peers))
 
-	var wg sync.WaitGroup
-	successCount := 0
-	errorCount := 0
+	var successCount, errorCount atomic.Int64
 
-	for _, peer := range peers {
+	// Feed a fixed set of workers rather than starting a goroutine per
+	// peer; the worker count also caps the load on the tracker, so the
+	// per-peer delay is no longer needed
+	jobs := make(chan *PeerContainer, registerWorkers)
+	var wg sync.WaitGroup
+	for w := 0; w < registerWorkers; w++ {
 		wg.Add(1)
-		go func(p *PeerContainer) {
+		go func() {
 			defer wg.Done()
-			if err := registerPeer(trackerURL, signalingURL, p); err == nil {
-				successCount++
-				if successCount%100 == 0 {
-					fmt.Printf("✅ Registered %d peers...\n", successCount)
+			for p := range jobs {
+				if err := registerPeer(trackerURL, signalingURL, p); err == nil {
+					if n := successCount.Add(1); n%100 == 0 {
+						fmt.Printf("✅ Registered %d peers...\n", n)
+					}
+				} else {
+					errorCount.Add(1)
 				}
-			} else {
-				errorCount++
 			}
-		}(peer)
-
-		// Small delay to avoid overwhelming tracker
-		time.Sleep(5 * time.Millisecond)
+		}()
 	}
 
+	for _, peer := range peers {
+		jobs <- peer
+	}
+	close(jobs)
 	wg.Wait()
 
 	fmt.Println()
 	fmt.Println("🎉 Strategic P2P Network Initialized!")
-	fmt.Printf("✅ Successfully registered: %d peers\n", successCount)
-	fmt.Printf("❌ Registration errors: %d\n", errorCount)
+	fmt.Printf("✅ Successfully registered: %d peers\n", successCount.Load())
+	fmt.Printf("❌ Registration errors: %d\n", errorCount.Load())
 	fmt.Println()
 
 	// Print actual distribution
 	fmt.Println("📊 Actual Segment Distribution:")
+	// Index the tracked segments once so each peer segment is counted with
+	// a single lookup instead of being compared against every segment
+	segmentIndex := make(map[string]int, len(segments))
+	for i, segment := range segments {
+		segmentIndex[segment] = i
+	}
 	segmentCounts := make([]int, len(segments))
 	for _, peer := range peers {
-		for segIdx, segment := range segments {
-			for _, peerSegment := range peer.Segments {
-				if peerSegment == segment {
-					segmentCounts[segIdx]++
-					break
-				}
+		for _, peerSegment := range peer.Segments {
+			if segIdx, ok := segmentIndex[peerSegment]; ok {
+				segmentCounts[segIdx]++
 			}
 		}
 	}
 
+	// Hoist the per-peer scale out of the loop; it also guards the
+	// zero-peer case, which would otherwise print NaN percentages
+	pctPerPeer := 0.0
+	if len(peers) > 0 {
+		pctPerPeer = 100 / float64(len(peers))
+	}
 	for i, segment := range segments {
 		segmentName := segment[len(segment)-15:] // Last part of segment name
-		percentage := float64(segmentCounts[i]) / float64(len(peers)) * 100
+		percentage := float64(segmentCounts[i]) * pctPerPeer
 		fmt.Printf("   %s: %d peers (%.1f%%)\n", segmentName, segmentCounts[i], percentage)
 	}
 
@@ -332,7 +363,29 @@ func min(a, b int) int {
 	return b
 }
 
-func createP2PMesh(peers []*PeerContainer) {
+// meshLinks is the set of connected peer pairs, keyed by sorted IDs
+type meshLinks map[[2]string]struct{}
+
+func linkKey(a, b string) [2]string {
+	if a > b {
+		a, b = b, a
+	}
+	return [2]string{a, b}
+}
+
+func (l meshLinks) has(a, b string) bool {
+	_, ok := l[linkKey(a, b)]
+	return ok
+}
+
+// connect links two peers both ways and records the pair
+func (l meshLinks) connect(a, b *PeerContainer) {
+	a.ConnectedPeers = append(a.ConnectedPeers, b.ID)
+	b.ConnectedPeers = append(b.ConnectedPeers, a.ID)
+	l[linkKey(a.ID, b.ID)] = struct{}{}
+}
+
+func createP2PMesh(peers []*PeerContainer, rng *rand.Rand) {
 	// Create realistic P2P mesh where regular peers connect to each other
 	// and seed peers form a backbone
 	
@@ -347,6 +400,10 @@ func createP2PMesh(peers []*PeerContainer) {
 		}
 	}
 
+	// Track existing links in a set rather than scanning ConnectedPeers,
+	// which grows large for seed peers
+	links := make(meshLinks)
+
 	fmt.Printf("   🌱 %d seed peers will connect to edge servers\n", len(seedPeers))
 	fmt.Printf("   👥 %d regular peers will form P2P mesh\n", len(regularPeers))
 
@@ -356,10 +413,9 @@ func createP2PMesh(peers []*PeerContainer) {
 
 		// Try to connect to at least one seed peer for content discovery
 		if len(seedPeers) > 0 && connectionsNeeded > 0 {
-			seedPeer := seedPeers[rand.Intn(len(seedPeers))]
+			seedPeer := seedPeers[rng.Intn(len(seedPeers))]
 			if len(seedPeer.ConnectedPeers) < seedPeer.MaxConnections {
-				peer.ConnectedPeers = append(peer.ConnectedPeers, seedPeer.ID)
-				seedPeer.ConnectedPeers = append(seedPeer.ConnectedPeers, peer.ID)
+				links.connect(peer, seedPeer)
 				connectionsNeeded--
 			}
 		}
@@ -370,7 +426,7 @@ func createP2PMesh(peers []*PeerContainer) {
 
 		for connectionsNeeded > 0 && attempts < maxAttempts {
 			attempts++
-			targetPeer := regularPeers[rand.Intn(len(regularPeers))]
+			targetPeer := regularPeers[rng.Intn(len(regularPeers))]
 
 			if targetPeer.ID == peer.ID {
 				continue
@@ -380,14 +436,7 @@ func createP2PMesh(peers []*PeerContainer) {
 				continue
 			}
 
-			// Check if already connected
-			alreadyConnected := false
-			for _, connectedID := range peer.ConnectedPeers {
-				if connectedID == targetPeer.ID {
-					alreadyConnected = true
-					break
-				}
-			}
+			alreadyConnected := links.has(peer.ID, targetPeer.ID)
 
 			if !alreadyConnected {
 				// Prefer same region connections
@@ -396,9 +445,8 @@ func createP2PMesh(peers []*PeerContainer) {
 					connectProbability = 0.8
 				}
 
-				if rand.Float64() < connectProbability {
-					peer.ConnectedPeers = append(peer.ConnectedPeers, targetPeer.ID)
-					targetPeer.ConnectedPeers = append(targetPeer.ConnectedPeers, peer.ID)
+				if rng.Float64() < connectProbability {
+					links.connect(peer, targetPeer)
 					connectionsNeeded--
 				}
 			}
@@ -411,18 +459,10 @@ func createP2PMesh(peers []*PeerContainer) {
 
 		for j, otherSeed := range seedPeers {
 			if i != j && connectionsNeeded > 0 && len(otherSeed.ConnectedPeers) < otherSeed.MaxConnections {
-				// Check if already connected
-				alreadyConnected := false
-				for _, connectedID := range seedPeer.ConnectedPeers {
-					if connectedID == otherSeed.ID {
-						alreadyConnected = true
-						break
-					}
-				}
+				alreadyConnected := links.has(seedPeer.ID, otherSeed.ID)
 
 				if !alreadyConnected {
-					seedPeer.ConnectedPeers = append(seedPeer.ConnectedPeers, otherSeed.ID)
-					otherSeed.ConnectedPeers = append(otherSeed.ConnectedPeers, seedPeer.ID)
+					links.connect(seedPeer, otherSeed)
 					connectionsNeeded--
 				}
 			}
@@ -437,7 +477,11 @@ func createP2PMesh(peers []*PeerContainer) {
 	totalConnections /= 2 // Each connection is counted twice
 
 	fmt.Printf("   ✅ P2P mesh created: %d total connections\n", totalConnections)
-	fmt.Printf("   📊 Average connections per peer: %.1f\n", float64(totalConnections*2)/float64(len(peers)))
+	avgConnections := 0.0
+	if len(peers) > 0 {
+		avgConnections = float64(totalConnections*2) / float64(len(peers))
+	}
+	fmt.Printf("   📊 Average connections per peer: %.1f\n", avgConnections)
 }
 
 func registerPeer(trackerURL, signalingURL string, peer *PeerContainer) error {